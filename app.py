@@ -1,58 +1,94 @@
 import streamlit as st
-import google.generativeai as genai
+import diskcache
+from google import genai as google_genai
+from google.genai import errors as genai_errors
 import requests
+import concurrent.futures
+import hashlib
+import io
+import json
+import logging
 import os
-import time
+import threading
+
+logger = logging.getLogger(__name__)
 
 # Configure the page
 st.set_page_config(page_title="Custom Home Design Assistant", page_icon="🏠", layout="wide")
 
-# Initialize the Gemini model using Streamlit secrets
-def initialize_model():
+MODEL_NAME = 'gemini-1.5-flash'
+
+# Initialize the Gemini client using Streamlit secrets (shared by all sessions)
+@st.cache_resource(show_spinner=False)
+def initialize_genai_client():
     try:
         api_key = st.secrets["GOOGLE_API_KEY"]
-        genai.configure(api_key=api_key)
-        return genai.GenerativeModel('gemini-1.5-flash')
+        return google_genai.Client(api_key=api_key)
     except Exception as e:
-        st.error(f"Failed to initialize model: {str(e)}")
+        st.error(f"Failed to initialize Gemini client: {str(e)}")
         st.stop()
 
-# Cache for designs
-if 'design_cache' not in st.session_state:
-    st.session_state.design_cache = {}
+# Fixed part of every design prompt
+DESIGN_INSTRUCTIONS = """Include:
+1. Design concept overview
+2. Layout with room sizes
+3. Furniture recommendations
+4. Materials and finishes
+5. Style-specific tips
 
-def get_cache_key(style, size, rooms, preferences):
-    return f"{style}_{size}_{rooms}_{preferences}"
+Format in Markdown with clear headings."""
 
-def generate_design_idea(model, style, size, rooms, preferences=""):
-    cache_key = get_cache_key(style, size, rooms, preferences)
-    if cache_key in st.session_state.design_cache:
-        return st.session_state.design_cache[cache_key]
-    
-    prompt = f"""Create a detailed custom home design plan with:
-    - Style: {style}
-    - Size: {size}
-    - Rooms: {rooms}
-    - Preferences: {preferences or "None"}
-    
-    Include:
-    1. Design concept overview
-    2. Layout with room sizes
-    3. Furniture recommendations
-    4. Materials and finishes
-    5. Style-specific tips
-    
-    Format in Markdown with clear headings."""
-    
-    try:
-        response = model.generate_content(prompt)
-        if response.text:
-            st.session_state.design_cache[cache_key] = response.text
-            return response.text
-    except Exception as e:
-        st.error(f"Error generating design: {str(e)}")
+# Variable part of every design prompt, parsed once at import
+_PROMPT_TMPL = """Create a detailed custom home design plan with:
+- Style: {style}
+- Size: {size}
+- Rooms: {rooms}
+- Preferences: {preferences}""".format
+
+def build_design_prompt(style, size, rooms, preferences):
+    details = _PROMPT_TMPL(style=style, size=size, rooms=rooms, preferences=preferences or "None")
+    return f"{details}\n\n{DESIGN_INSTRUCTIONS}"
+
+# Flex has no capacity guarantee; these status codes mean it is full right now
+_FLEX_CAPACITY_CODES = {429, 503}
+
+def _stream_content(style, size, rooms, preferences, service_tier):
+    prompt = build_design_prompt(style, size, rooms, preferences)
+    client = initialize_genai_client()
     
-    # Fallback content
+    if service_tier == "flex":
+        try:
+            stream = iter(client.models.generate_content_stream(
+                model=MODEL_NAME, contents=prompt, config={"service_tier": "flex"}
+            ))
+            first_chunk = next(stream, None)
+        except genai_errors.APIError as e:
+            if e.code not in _FLEX_CAPACITY_CODES:
+                raise
+            # Flex capacity exceeded, retry on the standard tier
+        else:
+            if first_chunk is not None:
+                yield first_chunk.text or ""
+            for chunk in stream:
+                yield chunk.text or ""
+            return
+    # Standard tier: the same call without a service_tier
+    for chunk in client.models.generate_content_stream(model=MODEL_NAME, contents=prompt):
+        yield chunk.text or ""
+
+class _CacheMiss(Exception):
+    pass
+
+# Designs are cached process-wide so repeat prompts skip the Gemini call.
+# Called without _design it only looks up the cache; a miss raises (and
+# exceptions are never cached). Called with the finished _design it stores it.
+@st.cache_data(ttl=24 * 60 * 60, max_entries=256, show_spinner=False)
+def _cached_design(style, size, rooms, preferences, _design=None):
+    if _design is None:
+        raise _CacheMiss
+    return _design
+
+def fallback_design(style, size, rooms):
     return f"""
     ## {style} Home Design: {size}, {rooms} Bedrooms
     
@@ -72,47 +108,367 @@ def generate_design_idea(model, style, size, rooms, preferences=""):
     Note: Custom design unavailable now. Try again later.
     """
 
+def get_cache_key(*args):
+    """Fixed-size digest of the design inputs, safe for arbitrarily long preferences"""
+    return hashlib.blake2b(repr(args).encode("utf-8"), digest_size=16).digest()
+
+# On-disk layer under the in-memory caches, so results survive app restarts.
+# It is best effort: any disk failure is logged and the app carries on without it.
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+@st.cache_resource(show_spinner=False)
+def open_disk_cache(name, size_limit):
+    try:
+        return diskcache.Cache(os.path.join(_CACHE_DIR, name), size_limit=size_limit)
+    except Exception:
+        logger.exception("Disk cache %s unavailable, continuing without it", name)
+        return None
+
+def _disk_get(cache, key):
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except Exception:
+        logger.exception("Disk cache read failed")
+        return None
+
+def _disk_set(cache, key, value, expire=None):
+    if cache is None:
+        return
+    try:
+        cache.set(key, value, expire=expire)
+    except Exception:
+        logger.exception("Disk cache write failed")
+
+_DESIGN_DISK = open_disk_cache("designs", 200_000_000)
+_UNSPLASH_DISK = open_disk_cache("unsplash", 20_000_000)
+
+# Generations in progress, so concurrent identical requests share one Gemini call.
+# Held as a resource so every session and rerun sees the same registry.
+@st.cache_resource(show_spinner=False)
+def _inflight_registry():
+    return {}, threading.Lock()
+
+_INFLIGHT, _INFLIGHT_LOCK = _inflight_registry()
+
+# How long a session waits on another session's identical generation
+_INFLIGHT_WAIT_SECONDS = 120
+
+def _lookup_design(style, size, rooms, preferences, cache_key):
+    """Design from the memory or disk cache, None on a miss"""
+    try:
+        return _cached_design(style, size, rooms, preferences)
+    except _CacheMiss:
+        pass
+    design = _disk_get(_DESIGN_DISK, cache_key)
+    if design:
+        return _cached_design(style, size, rooms, preferences, _design=design)
+    return None
+
+def _store_design(style, size, rooms, preferences, cache_key, design):
+    _cached_design(style, size, rooms, preferences, _design=design)
+    _disk_set(_DESIGN_DISK, cache_key, design)
+
+def generate_design_idea(style, size, rooms, preferences="", service_tier="flex", placeholder=None):
+    """Return the design, streaming it into placeholder as it is generated on a cache miss"""
+    cache_key = get_cache_key(style, size, rooms, preferences)
+    design = _lookup_design(style, size, rooms, preferences, cache_key)
+    if design:
+        return design
+    
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(cache_key)
+        is_leader = future is None
+        if is_leader:
+            # A previous leader may have stored the design and left since the lookup above
+            design = _lookup_design(style, size, rooms, preferences, cache_key)
+            if design:
+                return design
+            future = _INFLIGHT[cache_key] = concurrent.futures.Future()
+    
+    # Another session is already generating this design; wait for its result
+    if not is_leader:
+        try:
+            return future.result(timeout=_INFLIGHT_WAIT_SECONDS) or fallback_design(style, size, rooms)
+        except concurrent.futures.TimeoutError:
+            st.warning("This design is taking longer than expected. Showing a basic plan; try again shortly.")
+            return fallback_design(style, size, rooms)
+    
+    placeholder = placeholder or st.empty()
+    chunks = []
+    design = ""
+    try:
+        for text in _stream_content(style, size, rooms, preferences, service_tier):
+            chunks.append(text)
+            placeholder.markdown("".join(chunks), unsafe_allow_html=True)
+        design = "".join(chunks)
+        if design:
+            _store_design(style, size, rooms, preferences, cache_key, design)
+    except Exception as e:
+        design = ""
+        st.error(f"Error generating design: {str(e)}")
+    finally:
+        future.set_result(design)
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(cache_key, None)
+    
+    return design or fallback_design(style, size, rooms)
+
+_BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"
+}
+
+def submit_designs_batch(prompts):
+    """Submit prompts to the Gemini Batch API (half price, not latency-critical), returning the job name"""
+    client = initialize_genai_client()
+    jsonl = "\n".join(
+        json.dumps({"key": f"req_{i}", "request": {"contents": [{"parts": [{"text": prompt}]}]}})
+        for i, prompt in enumerate(prompts)
+    )
+    uploaded = client.files.upload(
+        file=io.BytesIO(jsonl.encode("utf-8")),
+        config={"display_name": "home-designs", "mime_type": "jsonl"}
+    )
+    return client.batches.create(model=MODEL_NAME, src=uploaded.name).name
+
+def collect_designs_batch(job_name, count):
+    """Designs from a finished batch job in submission order, None while it is still running"""
+    client = initialize_genai_client()
+    batch_job = client.batches.get(name=job_name)
+    if batch_job.state.name not in _BATCH_DONE_STATES:
+        return None
+    if batch_job.state.name != "JOB_STATE_SUCCEEDED":
+        raise RuntimeError(f"Batch job ended with state {batch_job.state.name}")
+    
+    # Results are not guaranteed to come back in submission order
+    results = {}
+    output = client.files.download(file=batch_job.dest.file_name).decode("utf-8")
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        try:
+            parts = item["response"]["candidates"][0]["content"]["parts"]
+            results[item["key"]] = "".join(part.get("text", "") for part in parts)
+        except (KeyError, IndexError):
+            results[item["key"]] = ""
+    return [results.get(f"req_{i}", "") for i in range(count)]
+
+def _check_bulk_jobs():
+    """Collect finished batch jobs into the session's bulk results and the design caches"""
+    still_running = []
+    for job in st.session_state.bulk_jobs:
+        try:
+            designs = collect_designs_batch(job["name"], len(job["specs"]))
+        except RuntimeError as e:
+            st.error(f"Error running batch job: {str(e)}")
+            continue
+        except Exception as e:
+            # Keep the job so it can be checked again
+            st.error(f"Error checking batch job: {str(e)}")
+            still_running.append(job)
+            continue
+        if designs is None:
+            still_running.append(job)
+            continue
+        for (style, size, rooms), design in zip(job["specs"], designs):
+            cache_key = get_cache_key(style, size, rooms, job["preferences"])
+            if design:
+                _store_design(style, size, rooms, job["preferences"], cache_key, design)
+            st.session_state.bulk_results[cache_key] = (
+                style, size, rooms, design or fallback_design(style, size, rooms)
+            )
+    st.session_state.bulk_jobs = still_running
+
+def render_bulk_generator(preferences):
+    st.markdown("### Bulk Generate")
+    st.caption("Submit several designs at once through the Gemini Batch API at half the cost. "
+               "Jobs run in the background and can take a while; check back for results.")
+    
+    # Jobs are tracked by name so reruns and widget changes never lose paid results.
+    # Results are keyed by design so a resubmitted row is shown only once.
+    if 'bulk_jobs' not in st.session_state:
+        st.session_state.bulk_jobs = []
+    if 'bulk_results' not in st.session_state:
+        st.session_state.bulk_results = {}
+    
+    with st.form("bulk_design_form"):
+        rows = st.data_editor(
+            [{"Style": "", "Size": "", "Rooms": ""}],
+            num_rows="dynamic",
+            width="stretch",
+            key="bulk_designs"
+        )
+        bulk_submitted = st.form_submit_button("Bulk Generate Designs")
+    
+    if bulk_submitted:
+        # Stripped like the main form, so stray whitespace is neither billed nor cached apart
+        specs = [tuple((r.get(col) or "").strip() for col in ("Style", "Size", "Rooms")) for r in rows]
+        specs = [spec for spec in specs if all(spec)]
+        if not specs:
+            st.warning("Please add at least one complete design row")
+        else:
+            # Designs already shown, cached or still in a submitted job are not paid for again
+            submitted_keys = {
+                get_cache_key(*spec, job["preferences"])
+                for job in st.session_state.bulk_jobs for spec in job["specs"]
+            }
+            pending = []
+            for style, size, rooms in specs:
+                cache_key = get_cache_key(style, size, rooms, preferences)
+                if cache_key in st.session_state.bulk_results or cache_key in submitted_keys:
+                    continue
+                design = _lookup_design(style, size, rooms, preferences, cache_key)
+                if design:
+                    st.session_state.bulk_results[cache_key] = (style, size, rooms, design)
+                else:
+                    submitted_keys.add(cache_key)
+                    pending.append((style, size, rooms))
+            
+            if pending:
+                try:
+                    job_name = submit_designs_batch(
+                        [build_design_prompt(style, size, rooms, preferences) for style, size, rooms in pending]
+                    )
+                    st.session_state.bulk_jobs.append(
+                        {"name": job_name, "specs": pending, "preferences": preferences}
+                    )
+                except Exception as e:
+                    st.error(f"Error submitting batch job: {str(e)}")
+    
+    if st.session_state.bulk_jobs:
+        if st.button("Check Status"):
+            _check_bulk_jobs()
+    if st.session_state.bulk_jobs:
+        st.info(f"{sum(len(job['specs']) for job in st.session_state.bulk_jobs)} designs still generating")
+        for job in st.session_state.bulk_jobs:
+            st.caption(f"Batch job: {job['name']}")
+    
+    for idx, (style, size, rooms, design) in enumerate(st.session_state.bulk_results.values()):
+        with st.expander(f"{style} - {size}, {rooms} Rooms"):
+            st.markdown(design, unsafe_allow_html=True)
+            st.download_button(
+                "Save Design Plan",
+                data=design,
+                file_name=f"{style}_home_design.md",
+                mime="text/markdown",
+                key=f"bulk_download_{idx}"
+            )
+
+# Sized for the one-third-width inspiration column, served as WebP
+IMAGE_PARAMS = "auto=compress&fit=crop&w=400&fm=webp&q=70"
+
+def _read_secret(name):
+    try:
+        return st.secrets[name]
+    except Exception:
+        return os.environ.get(name)
+
+# Shared session so repeat searches reuse the same TLS connection. Module
+# scope re-runs on every Streamlit rerun, so the session is held as a resource.
+@st.cache_resource(show_spinner=False)
+def _http_session():
+    return requests.Session()
+
+_HTTP = _http_session()
+UNSPLASH_ACCESS_KEY = _read_secret("UNSPLASH_ACCESS_KEY")
+
+# Unsplash requires hotlinked photos to credit the photographer, with these
+# referral params on every link back to Unsplash
+_UNSPLASH_UTM = "utm_source=ai_home_design_assistant&utm_medium=referral"
+
+@st.cache_data(ttl=60 * 60, max_entries=512, show_spinner=False)
+def _search_unsplash(query, num_images):
+    """(image URL, photographer name, photographer profile) for each result"""
+    # Versioned key so entries cached before credits were kept are not read back
+    disk_key = ("photos", query, num_images)
+    photos = _disk_get(_UNSPLASH_DISK, disk_key)
+    if photos is None:
+        response = _HTTP.get(
+            "https://api.unsplash.com/search/photos",
+            params={"query": query, "per_page": num_images, "orientation": "landscape"},
+            headers={"Authorization": f"Client-ID {UNSPLASH_ACCESS_KEY}"},
+            timeout=5
+        )
+        response.raise_for_status()
+        photos = [
+            (img["urls"]["raw"], img["user"]["name"], img["user"]["links"]["html"])
+            for img in response.json()["results"]
+        ]
+        _disk_set(_UNSPLASH_DISK, disk_key, photos, expire=24 * 60 * 60)
+    return [(f"{url}&{IMAGE_PARAMS}", name, profile) for url, name, profile in photos]
+
+def fetch_unsplash_images(query, num_images=3):
+    """Search Unsplash for images with their credits, empty if no access key is configured"""
+    if not UNSPLASH_ACCESS_KEY:
+        return []
+    try:
+        return _search_unsplash(query, num_images)
+    except Exception:
+        return []
+
+def unsplash_credit(photos):
+    """Markdown attribution line for Unsplash search results"""
+    names = ", ".join(f"[{name}]({profile}?{_UNSPLASH_UTM})" for _, name, profile in photos)
+    return f"Photos by {names} on [Unsplash](https://unsplash.com/?{_UNSPLASH_UTM})"
+
+# Predefined curated images for common styles, with size params already applied
+_STYLE_IMAGES = {
+    style: tuple(f"{url}?{IMAGE_PARAMS}" for url in urls)
+    for style, urls in {
+        "modern": (
+            "https://images.unsplash.com/photo-1600585154340-be6161a56a0c",
+            "https://images.unsplash.com/photo-1512917774080-9991f1c4c750",
+            "https://images.unsplash.com/photo-1605276374104-dee2a0ed3cd6"
+        ),
+        "rustic": (
+            "https://images.unsplash.com/photo-1600121848594-d8644e57abab",
+            "https://images.unsplash.com/photo-1600566752227-513c65e57d03",
+            "https://images.unsplash.com/photo-1600607688969-a5bfcd646154"
+        ),
+        "traditional": (
+            "https://images.unsplash.com/photo-1600607687920-4e2a09cf159d",
+            "https://images.unsplash.com/photo-1600566752355-35792bedcfea",
+            "https://images.unsplash.com/photo-1600607688969-a5bfcd646154"
+        )
+    }.items()
+}
+
+# Fallback images
+_FALLBACK_URLS = tuple(f"{url}?{IMAGE_PARAMS}" for url in (
+    "https://images.unsplash.com/photo-1506744038136-46273834b3fb",
+    "https://images.unsplash.com/photo-1512917774080-9991f1c4c750",
+    "https://images.unsplash.com/photo-1600566752227-513c65e57d03"
+))
+
+# Style keys are already lowercase, so matching only needs to lower the input
+_STYLE_IMAGE_ITEMS = tuple(_STYLE_IMAGES.items())
+_DEFAULT_STYLE_IMAGES = _STYLE_IMAGES["modern"]
+
 def fetch_design_images(style):
     """Fetch images from Unsplash without API key"""
     try:
-        # Predefined curated images for common styles
-        style_images = {
-            "modern": [
-                "https://images.unsplash.com/photo-1600585154340-be6161a56a0c",
-                "https://images.unsplash.com/photo-1512917774080-9991f1c4c750",
-                "https://images.unsplash.com/photo-1605276374104-dee2a0ed3cd6"
-            ],
-            "rustic": [
-                "https://images.unsplash.com/photo-1600121848594-d8644e57abab",
-                "https://images.unsplash.com/photo-1600566752227-513c65e57d03",
-                "https://images.unsplash.com/photo-1600607688969-a5bfcd646154"
-            ],
-            "traditional": [
-                "https://images.unsplash.com/photo-1600607687920-4e2a09cf159d",
-                "https://images.unsplash.com/photo-1600566752355-35792bedcfea",
-                "https://images.unsplash.com/photo-1600607688969-a5bfcd646154"
-            ]
-        }
-        
         # Find closest matching style
         style_lower = style.lower()
-        matched_style = next((s for s in style_images.keys() if s in style_lower), "modern")
-        return style_images[matched_style]
+        return next((urls for key, urls in _STYLE_IMAGE_ITEMS if key in style_lower), _DEFAULT_STYLE_IMAGES)
     except Exception:
-        # Fallback images
-        return [
-            "https://images.unsplash.com/photo-1506744038136-46273834b3fb",
-            "https://images.unsplash.com/photo-1512917774080-9991f1c4c750",
-            "https://images.unsplash.com/photo-1600566752227-513c65e57d03"
-        ]
+        return _FALLBACK_URLS
+
+def fetch_inspiration_images(style):
+    """Image URLs for the Visual Inspiration column, loaded by the browser from Unsplash's CDN,
+    and their attribution (None for the curated images)"""
+    photos = fetch_unsplash_images(f"{style} home interior")
+    if photos:
+        return [url for url, _, _ in photos], unsplash_credit(photos)
+    return list(fetch_design_images(style)), None
 
 def main():
     st.title("🏠 AI Home Design Assistant")
     st.markdown("Create personalized home designs instantly")
 
-    # Initialize model (will show error if secrets not configured)
-    if 'model' not in st.session_state:
-        st.session_state.model = initialize_model()
+    # Initialize client (will show error if secrets not configured)
+    initialize_genai_client()
 
     # Scenario selection
     scenario = st.radio(
@@ -126,6 +482,9 @@ def main():
         st.header("Design Preferences")
         budget = st.selectbox("Budget", ["Economy", "Mid-range", "Luxury"])
         priority = st.radio("Focus", ["Function", "Aesthetics", "Balance"])
+        speed = st.radio("Speed", ["Economy (Flex)", "Fast (Standard)"],
+                         help="Economy costs half as much but may take longer")
+        service_tier = "flex" if speed == "Economy (Flex)" else "standard"
 
     # Input form
     with st.form("design_form"):
@@ -149,49 +508,63 @@ def main():
 
     # Display results outside the form
     if submitted:
+        # Stray whitespace in the inputs would be billed as prompt tokens
+        style, size, rooms, extras = (value.strip() for value in (style, size, rooms, extras))
         if not all([style, size, rooms]):
             st.warning("Please complete all required fields")
         else:
-            with st.spinner("Creating your design..."):
-                preferences = f"Budget: {budget}, Priority: {priority}"
-                if extras:
-                    preferences += f", Extras: {extras}"
-                if amenities:
-                    preferences += f", Amenities: {', '.join(amenities)}"
-                
+            preferences = f"Budget: {budget}, Priority: {priority}"
+            if extras:
+                preferences += f", Extras: {extras}"
+            if amenities:
+                preferences += f", Amenities: {', '.join(amenities)}"
+            
+            # Lay out the results first so the design can stream into place
+            status = st.empty()
+            st.markdown("---")
+            
+            # Display in columns
+            col_text, col_img = st.columns([2, 1])
+            
+            with col_text:
+                st.markdown("### Your Design Plan")
+                design_placeholder = st.empty()
+            
+            # Images don't depend on the design, so fetch them while it generates
+            with st.spinner("Creating your design..."), \
+                    concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                images_future = executor.submit(fetch_inspiration_images, style)
                 design = generate_design_idea(
-                    st.session_state.model,
-                    style, size, rooms, preferences
+                    style, size, rooms, preferences, service_tier,
+                    design_placeholder
                 )
-                
-                image_urls = fetch_design_images(style)
-                
-                if design:
-                    st.success("Design Generated!")
-                    st.markdown("---")
-                    
-                    # Display in columns
-                    col_text, col_img = st.columns([2, 1])
-                    
-                    with col_text:
-                        st.markdown("### Your Design Plan")
-                        st.markdown(design, unsafe_allow_html=True)
-                    
-                    with col_img:
-                        st.markdown("### Visual Inspiration")
-                        for img_url in image_urls:
-                            st.image(img_url + "?auto=format&fit=crop&w=800&q=80", 
-                                   use_container_width=True)
-                    
-                    st.markdown("---")
-                    
-                    # Download button outside form
-                    st.download_button(
-                        "Save Design Plan",
-                        data=design,
-                        file_name=f"{style}_home_design.md",
-                        mime="text/markdown"
-                    )
+                image_urls, image_credit = images_future.result()
+            
+            status.success("Design Generated!")
+            design_placeholder.markdown(design, unsafe_allow_html=True)
+            
+            with col_img:
+                st.markdown("### Visual Inspiration")
+                # URLs go to the browser untouched, so it fetches the sized WebP
+                # from Unsplash's CDN once and serves reruns from its own cache
+                st.image(image_urls, width="stretch")
+                if image_credit:
+                    st.caption(image_credit)
+            
+            st.markdown("---")
+            
+            # Download button outside form
+            st.download_button(
+                "Save Design Plan",
+                data=design,
+                file_name=f"{style}_home_design.md",
+                mime="text/markdown"
+            )
+
+    # Multi-design workloads go through the cheaper Batch API
+    if scenario in ("Real Estate Development", "Architectural Firm"):
+        st.markdown("---")
+        render_bulk_generator(f"Budget: {budget}, Priority: {priority}")
 
 if __name__ == "__main__":
     main()